@@ -3,7 +3,8 @@
 Comprehensive WebDAV CRUD tests for notes and folders.
 
 Usage:
-    1. Start the WebDAV server:
+    1. Optionally start the WebDAV server (otherwise the tests start
+       ./target/release/webdav_server against a temporary database):
        ./target/release/webdav_server serve -d test.db -u testuser -P testpass
 
     2. Run tests:
@@ -13,14 +14,22 @@ Usage:
        pytest tests/test_webdav.py -v
 """
 
+import base64
+import concurrent.futures
+import ipaddress
 import os
+import re
 import subprocess
 import tempfile
 import time
 import unittest
-from urllib.parse import quote
+import xml.etree.ElementTree as ET
+from functools import lru_cache, partial
+from pathlib import Path
+from urllib.parse import quote, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 # Configuration
@@ -28,33 +37,148 @@ BASE_URL = os.environ.get("WEBDAV_URL", "http://127.0.0.1:4918")
 USERNAME = os.environ.get("WEBDAV_USER", "testuser")
 PASSWORD = os.environ.get("WEBDAV_PASS", "testpass")
 
-AUTH = HTTPBasicAuth(USERNAME, PASSWORD)
+# Release build started by run_server_fixture when no server is running
+SERVER_BINARY = Path(__file__).resolve().parents[1] / "target" / "release" / "webdav_server"
+
+# Accepted status codes per operation
+OK_WRITE = frozenset({200, 201, 204})
+OK_DELETE = frozenset({200, 204})
+OK_MKCOL = frozenset({200, 201})
+OK_LIST = frozenset({200, 207})
+FORBIDDEN = frozenset({403, 405})
+CONFLICT = frozenset({405, 409})
+
+# href values in a PROPFIND multistatus response
+HREF_RE = re.compile(r"<D:href>([^<]+)</D:href>")
+DAV_HREF = "{DAV:}href"
+
+# Shared session so every test reuses the same keep-alive connections; Basic
+# auth is a precomputed header rather than re-encoded on every request
+SESSION = requests.Session()
+_TOKEN = base64.b64encode(f"{USERNAME}:{PASSWORD}".encode("utf-8")).decode("ascii")
+SESSION.headers["Authorization"] = f"Basic {_TOKEN}"
+# Without session auth, requests would consult ~/.netrc on every request and
+# could replace the header with its credentials
+SESSION.trust_env = False
+
+# Connection pool size; parallel_map caps its workers here so no connection is discarded
+POOL_SIZE = 16
+_ADAPTER = HTTPAdapter(
+    pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+# Pooled sessions for the negative-auth tests, so they also reuse keep-alive
+NOAUTH_SESSION = requests.Session()
+WRONG_SESSION = requests.Session()
+WRONG_SESSION.auth = HTTPBasicAuth(USERNAME, "wrongpass")
+
+
+# (process, database) when this module started the server itself
+_SERVER = None
+
+
+def setUpModule():
+    global _SERVER
+    # Reuse a server that is already running, otherwise start a local one
+    if probe_server() is not None:
+        return
+    if _bind_host(urlparse(BASE_URL).hostname) is None:
+        raise RuntimeError(
+            f"No WebDAV server reachable at {BASE_URL}; start it there or point "
+            "WEBDAV_URL at a loopback address to have the tests start one"
+        )
+    if not SERVER_BINARY.exists():
+        raise RuntimeError(
+            f"No WebDAV server at {BASE_URL} and {SERVER_BINARY} is missing; "
+            "run `cargo build --release` or start a server first"
+        )
+    _SERVER = run_server_fixture()
+
+
+def tearDownModule():
+    for session in (SESSION, NOAUTH_SESSION, WRONG_SESSION):
+        session.close()
+    if _SERVER is not None:
+        proc, db_file = _SERVER
+        proc.terminate()
+        proc.wait()
+        os.unlink(db_file)
+
+
+def probe_server() -> requests.Response | None:
+    """GET the root once, returning None only if nothing accepts the connection."""
+    try:
+        return SESSION.get(BASE_URL + "/", timeout=2)
+    except requests.exceptions.ConnectionError:
+        return None
+
+
+def _bind_host(hostname: str | None) -> str | None:
+    """Return the -H value for a loopback hostname, or None if it is not local."""
+    if hostname == "localhost":
+        return "127.0.0.1"
+    try:
+        ip = ipaddress.ip_address(hostname)
+    except ValueError:
+        return None
+    if not ip.is_loopback:
+        return None
+    return f"[{ip}]" if ip.version == 6 else str(ip)
+
+
+def wait_for_server(timeout: float = 5.0) -> bool:
+    """Poll the root until the server answers, returning whether it came up."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            SESSION.get(BASE_URL + "/", timeout=0.1)
+            return True
+        except requests.exceptions.RequestException:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
+
+def parallel_map(func, items: list) -> list:
+    """Apply func to every item concurrently, returning results in order."""
+    workers = max(1, min(len(items), POOL_SIZE))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+@lru_cache(maxsize=512)
+def _full_url(base: str, path: str) -> str:
+    """Join base URL and path; the suite reuses a few dozen distinct paths."""
+    return base + (path if path.startswith("/") else "/" + path)
 
 
 class WebDAVClient:
     """Simple WebDAV client for testing."""
 
-    def __init__(self, base_url: str, auth: HTTPBasicAuth):
+    def __init__(self, base_url: str, session: requests.Session):
         self.base_url = base_url.rstrip("/")
-        self.auth = auth
-        self.session = requests.Session()
-        self.session.auth = auth
+        self.session = session
 
     def _url(self, path: str) -> str:
         """Build full URL from path."""
-        if not path.startswith("/"):
-            path = "/" + path
-        return self.base_url + path
+        return _full_url(self.base_url, path)
 
-    def get(self, path: str) -> requests.Response:
+    def get(self, path: str, stream: bool = False) -> requests.Response:
         """GET a resource (read file content)."""
-        return self.session.get(self._url(path))
+        return self.session.get(self._url(path), stream=stream)
+
+    def put(self, path: str, content: bytes | str) -> requests.Response:
+        """PUT a resource (create/update file).
 
-    def put(self, path: str, content: str) -> requests.Response:
-        """PUT a resource (create/update file)."""
+        Accepts pre-encoded bytes so large or repeated bodies are encoded once.
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
         return self.session.put(
             self._url(path),
-            data=content.encode("utf-8"),
+            data=content,
             headers={"Content-Type": "text/plain; charset=utf-8"},
         )
 
@@ -66,12 +190,15 @@ class WebDAVClient:
         """MKCOL - create a collection (folder)."""
         return self.session.request("MKCOL", self._url(path))
 
-    def propfind(self, path: str, depth: int = 1) -> requests.Response:
+    def propfind(
+        self, path: str, depth: int = 1, stream: bool = False
+    ) -> requests.Response:
         """PROPFIND - list directory contents."""
         return self.session.request(
             "PROPFIND",
             self._url(path),
             headers={"Depth": str(depth)},
+            stream=stream,
         )
 
     def exists(self, path: str) -> bool:
@@ -81,14 +208,16 @@ class WebDAVClient:
 
     def list_dir(self, path: str) -> list[str]:
         """List directory contents, returning resource names."""
-        resp = self.propfind(path, depth=1)
-        if resp.status_code != 207:
-            return []
-        # Parse the multistatus XML response
-        # Simple extraction of href values
-        import re
-
-        hrefs = re.findall(r"<D:href>([^<]+)</D:href>", resp.text)
+        with self.propfind(path, depth=1, stream=True) as resp:
+            if resp.status_code != 207:
+                return []
+            # Stream-parse the multistatus XML, keeping only href values
+            resp.raw.decode_content = True
+            hrefs = []
+            for _, elem in ET.iterparse(resp.raw, events=("end",)):
+                if elem.tag == DAV_HREF:
+                    hrefs.append(elem.text)
+                elem.clear()
         # Filter out the directory itself and extract names
         names = []
         base_path = path.rstrip("/") + "/"
@@ -108,18 +237,18 @@ class TestWebDAVAuth(unittest.TestCase):
 
     def test_unauthorized_without_auth(self):
         """Request without auth should return 401."""
-        resp = requests.get(BASE_URL + "/")
+        resp = NOAUTH_SESSION.get(BASE_URL + "/")
         self.assertEqual(resp.status_code, 401)
 
     def test_unauthorized_wrong_password(self):
         """Request with wrong password should return 401."""
-        resp = requests.get(BASE_URL + "/", auth=HTTPBasicAuth(USERNAME, "wrongpass"))
+        resp = WRONG_SESSION.get(BASE_URL + "/")
         self.assertEqual(resp.status_code, 401)
 
     def test_authorized_with_correct_credentials(self):
         """Request with correct credentials should succeed."""
-        resp = requests.get(BASE_URL + "/", auth=AUTH)
-        self.assertIn(resp.status_code, [200, 207])
+        resp = SESSION.get(BASE_URL + "/")
+        self.assertIn(resp.status_code, OK_LIST)
 
 
 class TestNoteCRUD(unittest.TestCase):
@@ -127,13 +256,13 @@ class TestNoteCRUD(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.client = WebDAVClient(BASE_URL, AUTH)
+        cls.client = WebDAVClient(BASE_URL, SESSION)
 
     def test_01_create_note(self):
         """Create a new note via PUT."""
         content = "# Test Note\n\nThis is test content."
         resp = self.client.put("/test_create.md", content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
     def test_02_read_note(self):
         """Read an existing note via GET."""
@@ -155,7 +284,7 @@ class TestNoteCRUD(unittest.TestCase):
         # Update the note
         updated_content = "# Updated Content\n\nThis has been modified."
         resp = self.client.put("/test_update.md", updated_content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Verify the update
         resp = self.client.get("/test_update.md")
@@ -178,7 +307,7 @@ class TestNoteCRUD(unittest.TestCase):
         # Create a note with long content
         long_content = "A" * 100  # 100 A's
         resp = self.client.put(path, long_content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Verify initial content
         resp = self.client.get(path)
@@ -189,7 +318,7 @@ class TestNoteCRUD(unittest.TestCase):
         # Update with shorter content
         short_content = "BBB"  # Only 3 chars
         resp = self.client.put(path, short_content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Immediately read back - should be exactly the short content
         resp = self.client.get(path)
@@ -220,7 +349,7 @@ class TestNoteCRUD(unittest.TestCase):
         for i in range(5):
             new_content = f"update_{i}_" + "x" * 50
             resp = self.client.put(path, new_content)
-            self.assertIn(resp.status_code, [200, 201, 204])
+            self.assertIn(resp.status_code, OK_WRITE)
 
             # Immediately read - should have the new content, not old
             resp = self.client.get(path)
@@ -239,7 +368,7 @@ class TestNoteCRUD(unittest.TestCase):
 
         # Delete it
         resp = self.client.delete("/test_delete.md")
-        self.assertIn(resp.status_code, [200, 204])
+        self.assertIn(resp.status_code, OK_DELETE)
 
         # Verify it's gone
         resp = self.client.get("/test_delete.md")
@@ -260,7 +389,7 @@ class TestNoteCRUD(unittest.TestCase):
         content = "# Spaced Note"
         path = "/My Test Note.md"
         resp = self.client.put(path, content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Read it back
         resp = self.client.get(path)
@@ -274,7 +403,7 @@ class TestNoteCRUD(unittest.TestCase):
         """Create a note with unicode content."""
         content = "# Unicode Test\n\n日本語テスト\némojis: 🎉🚀"
         resp = self.client.put("/unicode_test.md", content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Read it back
         resp = self.client.get("/unicode_test.md")
@@ -292,29 +421,35 @@ class TestNoteCRUD(unittest.TestCase):
             ("/test_file.html", "<html><body>Hello</body></html>"),
         ]
 
-        for path, content in test_cases:
-            with self.subTest(path=path):
-                resp = self.client.put(path, content)
-                self.assertIn(resp.status_code, [200, 201, 204])
+        paths = [path for path, _ in test_cases]
 
-                resp = self.client.get(path)
-                self.assertEqual(resp.status_code, 200)
-                self.assertEqual(resp.text, content)
+        # Create, read back and delete each batch concurrently
+        put_resps = parallel_map(lambda case: self.client.put(*case), test_cases)
+        get_resps = parallel_map(self.client.get, paths)
+        for (path, content), put_resp, get_resp in zip(test_cases, put_resps, get_resps):
+            with self.subTest(path=path):
+                self.assertIn(put_resp.status_code, OK_WRITE)
+                self.assertEqual(get_resp.status_code, 200)
+                self.assertEqual(get_resp.text, content)
 
-                # Clean up
-                self.client.delete(path)
+        # Clean up
+        parallel_map(self.client.delete, paths)
 
     def test_10_large_note(self):
         """Create and read a large note."""
-        # Create ~100KB of content
-        content = "# Large Note\n\n" + ("x" * 1000 + "\n") * 100
+        # Create ~100KB of content, built directly as bytes in one join
+        content = b"# Large Note\n\n" + b"\n".join([b"x" * 1000] * 100) + b"\n"
         resp = self.client.put("/large_note.md", content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
-        # Read it back
-        resp = self.client.get("/large_note.md")
-        self.assertEqual(resp.status_code, 200)
-        self.assertEqual(resp.text, content)
+        # Read it back, comparing chunk by chunk instead of buffering the body
+        with self.client.get("/large_note.md", stream=True) as resp:
+            self.assertEqual(resp.status_code, 200)
+            offset = 0
+            for chunk in resp.iter_content(8192):
+                self.assertEqual(chunk, content[offset : offset + len(chunk)])
+                offset += len(chunk)
+        self.assertEqual(offset, len(content))
 
         # Clean up
         self.client.delete("/large_note.md")
@@ -325,12 +460,12 @@ class TestFolderCRUD(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.client = WebDAVClient(BASE_URL, AUTH)
+        cls.client = WebDAVClient(BASE_URL, SESSION)
 
     def test_01_create_folder(self):
         """Create a new folder via MKCOL."""
         resp = self.client.mkcol("/TestFolder")
-        self.assertIn(resp.status_code, [200, 201])
+        self.assertIn(resp.status_code, OK_MKCOL)
 
     def test_02_list_folder(self):
         """List folder contents via PROPFIND."""
@@ -350,7 +485,7 @@ class TestFolderCRUD(unittest.TestCase):
         # Create note in folder
         content = "# Note in Folder"
         resp = self.client.put("/NoteTestFolder/nested_note.md", content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Read it back
         resp = self.client.get("/NoteTestFolder/nested_note.md")
@@ -364,12 +499,12 @@ class TestFolderCRUD(unittest.TestCase):
 
         # Create child folder
         resp = self.client.mkcol("/ParentFolder/ChildFolder")
-        self.assertIn(resp.status_code, [200, 201])
+        self.assertIn(resp.status_code, OK_MKCOL)
 
         # Create note in nested folder
         content = "# Deeply Nested"
         resp = self.client.put("/ParentFolder/ChildFolder/deep_note.md", content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Read it back
         resp = self.client.get("/ParentFolder/ChildFolder/deep_note.md")
@@ -380,7 +515,7 @@ class TestFolderCRUD(unittest.TestCase):
         # Create and then delete
         self.client.mkcol("/EmptyFolder")
         resp = self.client.delete("/EmptyFolder")
-        self.assertIn(resp.status_code, [200, 204])
+        self.assertIn(resp.status_code, OK_DELETE)
 
         # Verify it's gone
         resp = self.client.propfind("/EmptyFolder")
@@ -395,15 +530,18 @@ class TestFolderCRUD(unittest.TestCase):
 
         # Delete the folder
         resp = self.client.delete("/FolderWithNotes")
-        self.assertIn(resp.status_code, [200, 204])
-
-        # Verify folder is gone
-        resp = self.client.propfind("/FolderWithNotes")
-        self.assertEqual(resp.status_code, 404)
-
-        # Verify notes are gone too
-        resp = self.client.get("/FolderWithNotes/note1.md")
-        self.assertEqual(resp.status_code, 404)
+        self.assertIn(resp.status_code, OK_DELETE)
+
+        # Verify folder and notes are gone, checking both at once
+        folder_resp, note_resp = parallel_map(
+            lambda check: check(),
+            [
+                partial(self.client.propfind, "/FolderWithNotes"),
+                partial(self.client.get, "/FolderWithNotes/note1.md"),
+            ],
+        )
+        self.assertEqual(folder_resp.status_code, 404)
+        self.assertEqual(note_resp.status_code, 404)
 
     def test_07_delete_folder_with_nested_folders(self):
         """Delete a folder containing nested folders (deep recursive delete)."""
@@ -411,31 +549,41 @@ class TestFolderCRUD(unittest.TestCase):
         self.client.mkcol("/DeepFolder")
         self.client.mkcol("/DeepFolder/Level1")
         self.client.mkcol("/DeepFolder/Level1/Level2")
-        self.client.put("/DeepFolder/root_note.md", "Root note")
-        self.client.put("/DeepFolder/Level1/l1_note.md", "Level 1 note")
-        self.client.put("/DeepFolder/Level1/Level2/l2_note.md", "Level 2 note")
+        # Every parent now exists, so the notes can be created concurrently
+        parallel_map(
+            lambda note: self.client.put(*note),
+            [
+                ("/DeepFolder/root_note.md", "Root note"),
+                ("/DeepFolder/Level1/l1_note.md", "Level 1 note"),
+                ("/DeepFolder/Level1/Level2/l2_note.md", "Level 2 note"),
+            ],
+        )
 
         # Delete the top-level folder
         resp = self.client.delete("/DeepFolder")
-        self.assertIn(resp.status_code, [200, 204])
-
-        # Verify everything is gone
-        self.assertEqual(self.client.propfind("/DeepFolder").status_code, 404)
-        self.assertEqual(self.client.get("/DeepFolder/root_note.md").status_code, 404)
-        self.assertEqual(self.client.get("/DeepFolder/Level1/l1_note.md").status_code, 404)
-        self.assertEqual(
-            self.client.get("/DeepFolder/Level1/Level2/l2_note.md").status_code, 404
-        )
+        self.assertIn(resp.status_code, OK_DELETE)
+
+        # Verify everything is gone, issuing the checks concurrently
+        checks = [
+            partial(self.client.propfind, "/DeepFolder"),
+            partial(self.client.get, "/DeepFolder/root_note.md"),
+            partial(self.client.get, "/DeepFolder/Level1/l1_note.md"),
+            partial(self.client.get, "/DeepFolder/Level1/Level2/l2_note.md"),
+        ]
+        results = parallel_map(lambda check: check(), checks)
+        for check, resp in zip(checks, results):
+            with self.subTest(path=check.args[0]):
+                self.assertEqual(resp.status_code, 404)
 
     def test_08_create_folder_with_spaces(self):
         """Create a folder with spaces in the name."""
         resp = self.client.mkcol("/My Folder Name")
-        self.assertIn(resp.status_code, [200, 201])
+        self.assertIn(resp.status_code, OK_MKCOL)
 
         # Create a note in it
         content = "# In spaced folder"
         resp = self.client.put("/My Folder Name/test.md", content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         # Read it back
         resp = self.client.get("/My Folder Name/test.md")
@@ -450,7 +598,7 @@ class TestFolderCRUD(unittest.TestCase):
         self.client.mkcol("/DuplicateFolder")
         resp = self.client.mkcol("/DuplicateFolder")
         # Should return 405 Method Not Allowed or 409 Conflict
-        self.assertIn(resp.status_code, [405, 409])
+        self.assertIn(resp.status_code, CONFLICT)
 
         # Clean up
         self.client.delete("/DuplicateFolder")
@@ -471,12 +619,12 @@ class TestEdgeCases(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.client = WebDAVClient(BASE_URL, AUTH)
+        cls.client = WebDAVClient(BASE_URL, SESSION)
 
     def test_01_empty_content(self):
         """Create a note with empty content."""
         resp = self.client.put("/empty_note.md", "")
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         resp = self.client.get("/empty_note.md")
         self.assertEqual(resp.status_code, 200)
@@ -489,7 +637,7 @@ class TestEdgeCases(unittest.TestCase):
         """Create a note with special characters."""
         content = "Special chars: <>&\"'`~!@#$%^&*()[]{}|\\:;,.<>?"
         resp = self.client.put("/special_chars.md", content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         resp = self.client.get("/special_chars.md")
         self.assertEqual(resp.status_code, 200)
@@ -504,7 +652,7 @@ class TestEdgeCases(unittest.TestCase):
         # Using explicit URL encoding for spaces
         path = "/URL%20Encoded%20Note.md"
         resp = self.client.put(path, content)
-        self.assertIn(resp.status_code, [200, 201, 204])
+        self.assertIn(resp.status_code, OK_WRITE)
 
         resp = self.client.get(path)
         self.assertEqual(resp.status_code, 200)
@@ -520,8 +668,9 @@ class TestEdgeCases(unittest.TestCase):
         self.client.put("/TrailingSlashTest/note.md", "content")
 
         # PROPFIND with and without trailing slash should work
-        resp1 = self.client.propfind("/TrailingSlashTest")
-        resp2 = self.client.propfind("/TrailingSlashTest/")
+        resp1, resp2 = parallel_map(
+            self.client.propfind, ["/TrailingSlashTest", "/TrailingSlashTest/"]
+        )
         self.assertEqual(resp1.status_code, 207)
         self.assertEqual(resp2.status_code, 207)
 
@@ -531,7 +680,7 @@ class TestEdgeCases(unittest.TestCase):
     def test_05_delete_root_forbidden(self):
         """Deleting root should be forbidden."""
         resp = self.client.delete("/")
-        self.assertIn(resp.status_code, [403, 405])
+        self.assertIn(resp.status_code, FORBIDDEN)
 
     def test_06_propfind_depth_0(self):
         """PROPFIND with Depth: 0 should only return the resource itself."""
@@ -542,9 +691,7 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(resp.status_code, 207)
         # Should only contain info about the folder, not children
         # The response should have limited href entries
-        import re
-
-        hrefs = re.findall(r"<D:href>([^<]+)</D:href>", resp.text)
+        hrefs = HREF_RE.findall(resp.text)
         self.assertEqual(len(hrefs), 1)  # Only the folder itself
 
         # Clean up
@@ -554,9 +701,7 @@ class TestEdgeCases(unittest.TestCase):
         """HEAD request should return metadata without body."""
         self.client.put("/head_test.md", "Some content here")
 
-        session = requests.Session()
-        session.auth = AUTH
-        resp = session.head(BASE_URL + "/head_test.md")
+        resp = SESSION.head(BASE_URL + "/head_test.md")
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.text, "")  # No body
 
@@ -565,21 +710,22 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_08_concurrent_updates(self):
         """Test concurrent updates to the same note."""
-        import concurrent.futures
-
         path = "/concurrent_test.md"
         self.client.put(path, "initial")
 
-        def update(n):
-            return self.client.put(path, f"update {n}")
+        # Encode the bodies up front rather than inside the workers
+        bodies = [f"update {n}".encode("utf-8") for n in range(5)]
+
+        def update(body):
+            return self.client.put(path, body)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(update, i) for i in range(5)]
+            futures = [executor.submit(update, body) for body in bodies]
             results = [f.result() for f in futures]
 
         # All should succeed
         for resp in results:
-            self.assertIn(resp.status_code, [200, 201, 204])
+            self.assertIn(resp.status_code, OK_WRITE)
 
         # Clean up
         self.client.delete(path)
@@ -590,7 +736,7 @@ class TestCleanup(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.client = WebDAVClient(BASE_URL, AUTH)
+        cls.client = WebDAVClient(BASE_URL, SESSION)
 
     def test_cleanup(self):
         """Clean up any remaining test files and folders."""
@@ -607,17 +753,20 @@ class TestCleanup(unittest.TestCase):
             "/ParentFolder",
         ]
 
-        for path in cleanup_paths:
+        def delete(path):
             try:
                 self.client.delete(path)
             except Exception:
                 pass  # Ignore errors during cleanup
 
+        # The paths are independent, so delete them all at once
+        parallel_map(delete, cleanup_paths)
+
 
 def run_server_fixture():
     """
-    Helper to start the server for testing.
-    Returns the process handle.
+    Helper to start the server for testing on the host and port of BASE_URL.
+    Returns the process handle and the path of its temporary database.
     """
     # Create test database
     with tempfile.NamedTemporaryFile(mode="w", suffix=".sql", delete=False) as f:
@@ -645,27 +794,47 @@ CREATE TABLE IF NOT EXISTS notes (
         )
         sql_file = f.name
 
+    url = urlparse(BASE_URL)
+    port = url.port or (443 if url.scheme == "https" else 80)
     db_file = tempfile.mktemp(suffix=".db")
-    subprocess.run(["sqlite3", db_file], stdin=open(sql_file), check=True)
-
-    # Start server
-    proc = subprocess.Popen(
-        [
-            "./target/release/webdav_server",
-            "serve",
-            "-d",
-            db_file,
-            "-u",
-            USERNAME,
-            "-P",
-            PASSWORD,
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    # Wait for server to be ready
-    time.sleep(2)
+    proc = None
+    try:
+        with open(sql_file) as schema:
+            subprocess.run(["sqlite3", db_file], stdin=schema, check=True)
+
+        # Start server
+        proc = subprocess.Popen(
+            [
+                str(SERVER_BINARY),
+                "serve",
+                "-d",
+                db_file,
+                "-H",
+                _bind_host(url.hostname),
+                "-p",
+                str(port),
+                "-u",
+                USERNAME,
+                "-P",
+                PASSWORD,
+            ],
+            # The server logs every request; an unread pipe would eventually block it
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        # Wait for server to be ready
+        if not wait_for_server():
+            raise RuntimeError(f"WebDAV server did not start at {BASE_URL}")
+    except BaseException:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+        if os.path.exists(db_file):
+            os.unlink(db_file)
+        raise
+    finally:
+        os.unlink(sql_file)
     return proc, db_file
 
 
@@ -675,14 +844,11 @@ if __name__ == "__main__":
     print()
 
     # Check if server is running
-    try:
-        resp = requests.get(BASE_URL + "/", auth=AUTH, timeout=2)
+    resp = probe_server()
+    if resp is not None:
         print(f"Server is running (status: {resp.status_code})")
-    except requests.exceptions.ConnectionError:
-        print("ERROR: Server is not running!")
-        print(f"Please start the server first:")
-        print(f"  ./target/release/webdav_server serve -d <database> -u {USERNAME} -P {PASSWORD}")
-        exit(1)
+    else:
+        print(f"Server is not running, starting {SERVER_BINARY}")
 
     print()
     print("=" * 60)